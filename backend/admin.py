@@ -0,0 +1,252 @@
+from fastapi import APIRouter, HTTPException, Query
+from pymongo.errors import DuplicateKeyError
+from typing import List
+from datetime import datetime, timezone, timedelta
+import os
+import re
+
+from analytics import ensure_analytics_indexes
+from catalog import invalidate_catalog_cache, load_catalog_cache
+from database import client, db, pool_metrics
+from inventory import make_sku, set_stock
+from lifecycle import LIFECYCLE_MODE, lifecycle_metrics
+from models import Product, ProductCreate, ProductUpdate, Newsletter, InventoryUpdate
+
+router = APIRouter(prefix="/api")
+
+# ============== PRODUCTS ==============
+
+@router.post("/admin/products", response_model=Product)
+async def create_product(product_data: ProductCreate):
+    product = Product(**product_data.model_dump())
+    doc = product.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    doc['updated_at'] = doc['updated_at'].isoformat()
+    await db.products.insert_one(doc)
+    if product_data.stock is not None:
+        await set_stock(product.id, None, product_data.stock)
+        product.in_stock = product_data.stock > 0
+    invalidate_catalog_cache(read_primary=True)
+    return product
+
+@router.put("/admin/products/{product_id}", response_model=Product)
+async def update_product(product_id: str, product_data: ProductUpdate):
+    existing = await db.products.find_one({"id": product_id}, {"_id": 0})
+    if not existing:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    update_data = {k: v for k, v in product_data.model_dump().items() if v is not None}
+    stock = update_data.pop('stock', None)
+    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    
+    await db.products.update_one({"id": product_id}, {"$set": update_data})
+    if stock is not None:
+        await set_stock(product_id, None, stock)
+    invalidate_catalog_cache(read_primary=True)
+    updated = await db.products.find_one({"id": product_id}, {"_id": 0})
+    if isinstance(updated.get('created_at'), str):
+        updated['created_at'] = datetime.fromisoformat(updated['created_at'])
+    if isinstance(updated.get('updated_at'), str):
+        updated['updated_at'] = datetime.fromisoformat(updated['updated_at'])
+    return updated
+
+@router.delete("/admin/products/{product_id}")
+async def delete_product(product_id: str):
+    result = await db.products.delete_one({"id": product_id})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    invalidate_catalog_cache(read_primary=True)
+    return {"message": "Product deleted successfully"}
+
+# ============== NEWSLETTER ==============
+
+@router.get("/admin/newsletter", response_model=List[Newsletter])
+async def get_newsletter_subscribers():
+    subscribers = await db.newsletter.find({}, {"_id": 0}).to_list(1000)
+    for s in subscribers:
+        if isinstance(s.get('subscribed_at'), str):
+            s['subscribed_at'] = datetime.fromisoformat(s['subscribed_at'])
+    return subscribers
+
+# ============== INVENTORY ==============
+
+@router.get("/admin/inventory/{product_id}")
+async def get_inventory(product_id: str):
+    shards = await db.inventory_shards.aggregate([
+        {"$match": {"sku": {"$regex": f"^{re.escape(product_id)}(:|$)"}}},
+        {"$group": {"_id": "$sku", "stock": {"$sum": "$stock"}}}
+    ]).to_list(100)
+    return [{"sku": s["_id"], "stock": s["stock"]} for s in shards]
+
+@router.put("/admin/inventory/{product_id}")
+async def update_inventory(product_id: str, data: InventoryUpdate):
+    existing = await db.products.find_one({"id": product_id}, {"_id": 0, "id": 1})
+    if not existing:
+        raise HTTPException(status_code=404, detail="Product not found")
+    available = await set_stock(product_id, data.variant, data.quantity)
+    # stock is what new checkouts can reserve; the rest is held by open carts
+    return {"sku": make_sku(product_id, data.variant), "on_hand": data.quantity, "stock": available}
+
+# ============== ORDER LIFECYCLE ==============
+
+@router.get("/admin/orders/needs-review")
+async def get_orders_needing_review():
+    # Late payments that re-took released stock; these need a person to confirm fulfilment
+    return await db.orders.find(
+        {"needs_review": True}, {"_id": 0}
+    ).sort("created_at", -1).to_list(100)
+
+@router.get("/admin/lifecycle/metrics")
+async def get_lifecycle_metrics():
+    return {
+        **lifecycle_metrics,
+        "mode": LIFECYCLE_MODE,
+        "working_set": {
+            "orders": await db.orders.estimated_document_count(),
+            "payment_transactions": await db.payment_transactions.estimated_document_count(),
+            "inventory_reservations": await db.inventory_reservations.estimated_document_count(),
+        }
+    }
+
+# ============== DATABASE ==============
+
+@router.get("/admin/db/metrics")
+async def get_db_metrics():
+    metrics = dict(pool_metrics.metrics)
+    checkouts = metrics["checkouts"] or 1
+    metrics["wait_ms_avg"] = round(metrics["wait_ms_total"] / checkouts, 3)
+    metrics["held_ms_avg"] = round(metrics["held_ms_total"] / checkouts, 3)
+    metrics["max_pool_size"] = client.options.pool_options.max_pool_size
+    return metrics
+
+# ============== ANALYTICS ==============
+
+BACKFILL_LOCK_KEY = "sales_backfill"
+# A lock older than this belongs to a backfill whose worker died mid-run
+BACKFILL_LOCK_TIMEOUT_SECONDS = int(os.environ.get('BACKFILL_LOCK_TIMEOUT_SECONDS', '600'))
+
+async def backfill_sales_rollups(include_today: bool = False):
+    now = datetime.now(timezone.utc)
+    # Mongo keeps millisecond precision; truncate so claimed_at can be matched exactly later
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    stale_before = now - timedelta(seconds=BACKFILL_LOCK_TIMEOUT_SECONDS)
+    # One backfill at a time: overlapping runs would delete each other's merged days
+    try:
+        await db.app_meta.find_one_and_update(
+            {"key": BACKFILL_LOCK_KEY, "claimed_at": {"$lt": stale_before}},
+            {"$set": {"key": BACKFILL_LOCK_KEY, "claimed_at": now}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return {"message": "Sales backfill already running", "rebuilt": False}
+    try:
+        return await _rebuild_sales_rollups(now, include_today)
+    finally:
+        await db.app_meta.delete_one({"key": BACKFILL_LOCK_KEY, "claimed_at": now})
+
+async def _rebuild_sales_rollups(now: datetime, include_today: bool):
+    # record_sale only ever increments the current UTC day (paid_at is "now"), so rebuilding
+    # strictly earlier days and merging them in can't drop a live increment. Rebuilding
+    # today too replaces its live counters and should only be done with checkout paused.
+    today = now.strftime("%Y-%m-%d")
+    cutoff = (now + timedelta(days=1)).strftime("%Y-%m-%d") if include_today else today
+    rebuilt_at = now.isoformat()
+    closed_days = [
+        {"$match": {"payment_status": "paid"}},
+        {"$addFields": {"day": {"$substrBytes": [{"$ifNull": ["$paid_at", "$created_at"]}, 0, 10]}}},
+        {"$match": {"day": {"$lt": cutoff}}}
+    ]
+    await ensure_analytics_indexes()
+    await db.orders.aggregate(closed_days + [
+        {"$group": {
+            "_id": "$day",
+            "revenue": {"$sum": "$total"},
+            "net_sales": {"$sum": "$subtotal"},
+            "orders": {"$sum": 1},
+            "items_sold": {"$sum": {"$sum": "$items.quantity"}}
+        }},
+        {"$project": {
+            "_id": 0, "date": "$_id", "revenue": 1, "net_sales": 1, "orders": 1, "items_sold": 1,
+            "rebuilt_at": rebuilt_at
+        }},
+        {"$merge": {"into": "sales_daily", "on": "date", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]).to_list(None)
+    await db.orders.aggregate(closed_days + [
+        {"$unwind": "$items"},
+        {"$group": {
+            "_id": {"date": "$day", "product_id": "$items.product_id"},
+            "product_name": {"$last": "$items.product_name"},
+            "units": {"$sum": "$items.quantity"},
+            "revenue": {"$sum": {"$multiply": ["$items.price", "$items.quantity"]}}
+        }},
+        {"$project": {
+            "_id": 0, "date": "$_id.date", "product_id": "$_id.product_id",
+            "product_name": 1, "units": 1, "revenue": 1, "rebuilt_at": rebuilt_at
+        }},
+        {"$merge": {
+            "into": "sales_product_daily", "on": ["date", "product_id"],
+            "whenMatched": "replace", "whenNotMatched": "insert"
+        }}
+    ]).to_list(None)
+    # Rebuilt-range rollups older than this run (or never rebuilt) have no paid orders behind them
+    for rollup in (db.sales_daily, db.sales_product_daily):
+        await rollup.delete_many({"date": {"$lt": cutoff}, "rebuilt_at": {"$not": {"$gte": rebuilt_at}}})
+    days = await db.sales_daily.count_documents({"date": {"$lt": cutoff}})
+    if include_today:
+        message = f"Rebuilt sales rollups for {days} days through {today}"
+    else:
+        message = (
+            f"Rebuilt sales rollups for {days} days before {today}; "
+            f"{today} is maintained live and is rebuilt by tomorrow's backfill"
+        )
+    # live_day: the day left to record_sale's counters, if any
+    return {"message": message, "rebuilt": True, "days": days, "live_day": None if include_today else today}
+
+@router.post("/admin/analytics/backfill")
+async def backfill_analytics(include_today: bool = False):
+    # include_today rebuilds the live day as well; run it with checkout paused
+    return await backfill_sales_rollups(include_today)
+
+@router.get("/admin/analytics/sales")
+async def get_sales_analytics(
+    start: str = Query(pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    end: str = Query(pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    top: int = Query(default=5, ge=1, le=50)
+):
+    date_range = {"date": {"$gte": start, "$lte": end}}
+    daily = await db.sales_daily.find(date_range, {"_id": 0}).sort("date", 1).to_list(None)
+    top_products = await db.sales_product_daily.aggregate([
+        {"$match": date_range},
+        {"$group": {
+            "_id": "$product_id",
+            "product_name": {"$last": "$product_name"},
+            "units": {"$sum": "$units"},
+            "revenue": {"$sum": "$revenue"}
+        }},
+        {"$sort": {"revenue": -1}},
+        {"$limit": top},
+        {"$project": {"_id": 0, "product_id": "$_id", "product_name": 1, "units": 1, "revenue": 1}}
+    ]).to_list(top)
+    
+    revenue = sum(d["revenue"] for d in daily)
+    orders = sum(d["orders"] for d in daily)
+    return {
+        "start": start,
+        "end": end,
+        "revenue": round(revenue, 2),
+        "orders": orders,
+        "average_order_value": round(revenue / orders, 2) if orders else 0.0,
+        "daily": daily,
+        "top_products": top_products
+    }
+
+# ============== SEED DATA ==============
+
+@router.post("/admin/seed")
+async def seed_products():
+    # The seed catalog literal is only loaded when seeding is actually requested
+    from seed import seed_catalog
+    result = await seed_catalog()
+    if result["seeded"]:
+        await load_catalog_cache()
+    return result
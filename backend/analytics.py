@@ -0,0 +1,35 @@
+from typing import Dict, Any
+
+from database import db
+
+# ============== ANALYTICS ==============
+
+# Rollups are keyed by UTC day ("YYYY-MM-DD") so range reads never touch orders
+def order_day(order: Dict[str, Any]) -> str:
+    return (order.get("paid_at") or order["created_at"])[:10]
+
+async def record_sale(order: Dict[str, Any]):
+    day = order_day(order)
+    await db.sales_daily.update_one(
+        {"date": day},
+        {"$inc": {
+            "revenue": order["total"],
+            "net_sales": order["subtotal"],
+            "orders": 1,
+            "items_sold": sum(item["quantity"] for item in order["items"])
+        }},
+        upsert=True
+    )
+    for item in order["items"]:
+        await db.sales_product_daily.update_one(
+            {"date": day, "product_id": item["product_id"]},
+            {
+                "$inc": {"units": item["quantity"], "revenue": item["price"] * item["quantity"]},
+                "$set": {"product_name": item["product_name"]}
+            },
+            upsert=True
+        )
+
+async def ensure_analytics_indexes():
+    await db.sales_daily.create_index("date", unique=True)
+    await db.sales_product_daily.create_index([("date", 1), ("product_id", 1)], unique=True)
@@ -0,0 +1,155 @@
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Dict, Any
+from datetime import datetime
+import os
+import asyncio
+import time
+
+from database import catalog_db, db
+from models import Product, Review, ReviewCreate
+
+router = APIRouter(prefix="/api")
+
+# ============== CONSTANTS ==============
+CATEGORIES = [
+    {"id": "ice-rollers", "name": "Ice Rollers", "slug": "ice-rollers"},
+    {"id": "scalp-massagers", "name": "Scalp Massagers", "slug": "scalp-massagers"},
+    {"id": "gua-sha", "name": "Gua Sha Tools", "slug": "gua-sha"},
+    {"id": "face-rollers", "name": "Face Rollers", "slug": "face-rollers"},
+    {"id": "hair-oil-applicators", "name": "Hair Oil Applicators", "slug": "hair-oil-applicators"},
+    {"id": "under-eye-tools", "name": "Under Eye Tools", "slug": "under-eye-tools"},
+    {"id": "cleansing-brushes", "name": "Cleansing Brushes", "slug": "cleansing-brushes"},
+    {"id": "beauty-organizers", "name": "Beauty Organizers", "slug": "beauty-organizers"},
+]
+
+# ============== CATALOG CACHE ==============
+
+CATALOG_CACHE_TTL = float(os.environ.get('CATALOG_CACHE_TTL', '60'))
+
+# Hot catalog data preloaded at startup so the first storefront request skips Mongo.
+# Invalidation bumps "version" instead of dropping the list, so readers keep being served
+# while one request refreshes it.
+catalog_cache: Dict[str, Any] = {
+    "featured": None,
+    "loaded_at": 0.0,
+    "version": 0,
+    "loaded_version": 0,
+    "read_primary": False,
+}
+# Single-flight: concurrent misses share one load instead of each querying Mongo
+_refresh_lock = asyncio.Lock()
+
+async def load_catalog_cache(source=None):
+    # Defaults to the primary: callers after a write or seed must not cache a lagging secondary
+    source = db if source is None else source
+    version = catalog_cache["version"]
+    featured = await source.products.find({"featured": True}, {"_id": 0}).to_list(100)
+    for p in featured:
+        if isinstance(p.get('created_at'), str):
+            p['created_at'] = datetime.fromisoformat(p['created_at'])
+        if isinstance(p.get('updated_at'), str):
+            p['updated_at'] = datetime.fromisoformat(p['updated_at'])
+    catalog_cache["featured"] = featured
+    catalog_cache["loaded_at"] = time.monotonic()
+    # An invalidation that landed mid-load leaves the version behind, so the next read refreshes again
+    catalog_cache["loaded_version"] = version
+    if source is db and version == catalog_cache["version"]:
+        catalog_cache["read_primary"] = False
+    return featured
+
+def _cache_is_fresh() -> bool:
+    return (
+        catalog_cache["featured"] is not None
+        and catalog_cache["loaded_version"] == catalog_cache["version"]
+        and time.monotonic() - catalog_cache["loaded_at"] <= CATALOG_CACHE_TTL
+    )
+
+async def get_featured_products():
+    if _cache_is_fresh():
+        return catalog_cache["featured"]
+    if catalog_cache["featured"] is not None and _refresh_lock.locked():
+        # Another request is already refreshing; keep serving the current set until it lands
+        return catalog_cache["featured"]
+    async with _refresh_lock:
+        if _cache_is_fresh():
+            return catalog_cache["featured"]
+        # Only admin writes need read-your-writes; TTL and stock refreshes tolerate bounded staleness
+        if catalog_cache["featured"] is None or catalog_cache["read_primary"]:
+            return await load_catalog_cache(db)
+        return await load_catalog_cache(catalog_db)
+
+def invalidate_catalog_cache(read_primary: bool = False):
+    catalog_cache["version"] += 1
+    if read_primary:
+        catalog_cache["read_primary"] = True
+
+# ============== PRODUCT ENDPOINTS ==============
+
+@router.get("/products", response_model=List[Product])
+async def get_products(
+    category: Optional[str] = None,
+    featured: Optional[bool] = None,
+    search: Optional[str] = None,
+    limit: int = Query(default=50, le=100),
+    skip: int = 0
+):
+    # Storefront homepage query is served from the preloaded featured set
+    if featured and not category and not search:
+        return (await get_featured_products())[skip:skip + limit]
+    
+    query = {}
+    if category:
+        query["category"] = category
+    if featured is not None:
+        query["featured"] = featured
+    if search:
+        query["$or"] = [
+            {"name": {"$regex": search, "$options": "i"}},
+            {"description": {"$regex": search, "$options": "i"}}
+        ]
+    
+    products = await catalog_db.products.find(query, {"_id": 0}).skip(skip).limit(limit).to_list(limit)
+    for p in products:
+        if isinstance(p.get('created_at'), str):
+            p['created_at'] = datetime.fromisoformat(p['created_at'])
+        if isinstance(p.get('updated_at'), str):
+            p['updated_at'] = datetime.fromisoformat(p['updated_at'])
+    return products
+
+@router.get("/products/{product_id}", response_model=Product)
+async def get_product(product_id: str):
+    product = await catalog_db.products.find_one({"id": product_id}, {"_id": 0})
+    if not product:
+        # Try by slug
+        product = await catalog_db.products.find_one({"slug": product_id}, {"_id": 0})
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    if isinstance(product.get('created_at'), str):
+        product['created_at'] = datetime.fromisoformat(product['created_at'])
+    if isinstance(product.get('updated_at'), str):
+        product['updated_at'] = datetime.fromisoformat(product['updated_at'])
+    return product
+
+# ============== CATEGORIES ==============
+
+@router.get("/categories")
+async def get_categories():
+    return CATEGORIES
+
+# ============== REVIEWS ==============
+
+@router.get("/reviews/{product_id}", response_model=List[Review])
+async def get_product_reviews(product_id: str):
+    reviews = await catalog_db.reviews.find({"product_id": product_id}, {"_id": 0}).to_list(100)
+    for r in reviews:
+        if isinstance(r.get('created_at'), str):
+            r['created_at'] = datetime.fromisoformat(r['created_at'])
+    return reviews
+
+@router.post("/reviews", response_model=Review)
+async def create_review(review_data: ReviewCreate):
+    review = Review(**review_data.model_dump())
+    doc = review.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    await db.reviews.insert_one(doc)
+    return review
@@ -0,0 +1,261 @@
+from fastapi import APIRouter, HTTPException, Request
+from pymongo import ReturnDocument
+from typing import Dict, Any
+from datetime import datetime, timezone, timedelta
+import os
+import uuid
+import logging
+
+from analytics import record_sale
+from database import db
+from inventory import (
+    OutOfStockError,
+    sku_product_id,
+    reserve_inventory,
+    commit_reservation,
+    release_reservation
+)
+from lifecycle import restore_archived_checkout
+from models import CartRequest, CheckoutRequest, Order, PaymentTransaction
+
+router = APIRouter(prefix="/api")
+logger = logging.getLogger(__name__)
+
+# ============== CONSTANTS ==============
+SHIPPING_RATE = 9.95
+FREE_SHIPPING_THRESHOLD = 75.0
+TAX_RATE = 0.13  # Ontario HST
+CHECKOUT_SESSION_TTL_MINUTES = int(os.environ.get('CHECKOUT_SESSION_TTL_MINUTES', '1440'))  # Stripe session lifetime
+
+# ============== CART & SHIPPING ==============
+
+@router.post("/calculate-shipping")
+async def calculate_shipping(cart: CartRequest):
+    subtotal = sum(item.price * item.quantity for item in cart.items)
+    shipping = 0.0 if subtotal >= FREE_SHIPPING_THRESHOLD else SHIPPING_RATE
+    tax = (subtotal + shipping) * TAX_RATE
+    total = subtotal + shipping + tax
+    
+    return {
+        "subtotal": round(subtotal, 2),
+        "shipping": round(shipping, 2),
+        "tax": round(tax, 2),
+        "total": round(total, 2),
+        "free_shipping_threshold": FREE_SHIPPING_THRESHOLD,
+        "tax_rate": TAX_RATE
+    }
+
+# ============== CHECKOUT & PAYMENTS ==============
+
+def get_stripe_checkout(webhook_url: str = ""):
+    # The Stripe integration is imported on the first payment call, not at worker boot
+    from emergentintegrations.payments.stripe.checkout import StripeCheckout
+    return StripeCheckout(api_key=os.environ.get('STRIPE_API_KEY'), webhook_url=webhook_url)
+
+def generate_order_number():
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    unique_part = str(uuid.uuid4())[:6].upper()
+    return f"BV-{timestamp}-{unique_part}"
+
+async def ensure_checkout_in_hot_storage(session_id: str):
+    if await db.payment_transactions.find_one({"session_id": session_id}, {"_id": 1}) is None:
+        await restore_archived_checkout(session_id)
+
+async def mark_order_paid(order_id: str):
+    # Status poll and webhook both land here; only the first transition has side effects
+    order = await db.orders.find_one_and_update(
+        {"id": order_id, "payment_status": {"$ne": "paid"}},
+        {"$set": {
+            "status": "confirmed",
+            "payment_status": "paid",
+            "paid_at": datetime.now(timezone.utc).isoformat()
+        }, "$unset": {"expires_at": "", "purge_at": ""}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if order is None:
+        if await db.orders.find_one({"id": order_id}, {"_id": 1}) is None:
+            logger.error(f"Payment confirmed for order {order_id}, which no longer exists")
+        return
+    await commit_reservation(order_id)
+    await record_sale(order)
+
+@router.post("/checkout")
+async def create_checkout(data: CheckoutRequest, request: Request):
+    # Calculate totals server-side to prevent manipulation
+    subtotal = sum(item.price * item.quantity for item in data.items)
+    shipping = 0.0 if subtotal >= FREE_SHIPPING_THRESHOLD else SHIPPING_RATE
+    tax = (subtotal + shipping) * TAX_RATE
+    total = subtotal + shipping + tax
+    
+    # Create order
+    order_number = generate_order_number()
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=CHECKOUT_SESSION_TTL_MINUTES)
+    order = Order(
+        order_number=order_number,
+        items=[item.model_dump() for item in data.items],
+        shipping_address=data.shipping_address.model_dump(),
+        subtotal=round(subtotal, 2),
+        shipping_cost=round(shipping, 2),
+        tax=round(tax, 2),
+        total=round(total, 2),
+        expires_at=expires_at
+    )
+    
+    # Hold stock before the order exists so a sold-out cart never creates one
+    try:
+        await reserve_inventory(order.id, data.items, expires_at)
+    except OutOfStockError as e:
+        product = await db.products.find_one({"id": sku_product_id(e.sku)}, {"_id": 0, "name": 1})
+        name = product["name"] if product else e.sku
+        raise HTTPException(status_code=409, detail=f"{name} is out of stock")
+    
+    order_doc = order.model_dump()
+    order_doc['created_at'] = order_doc['created_at'].isoformat()
+    await db.orders.insert_one(order_doc)
+    
+    # Create Stripe checkout session
+    from emergentintegrations.payments.stripe.checkout import CheckoutSessionRequest
+    host_url = data.origin_url.rstrip('/')
+    webhook_url = f"{str(request.base_url).rstrip('/')}api/webhook/stripe"
+    
+    stripe_checkout = get_stripe_checkout(webhook_url)
+    
+    success_url = f"{host_url}/order-confirmation?session_id={{CHECKOUT_SESSION_ID}}"
+    cancel_url = f"{host_url}/cart"
+    
+    checkout_request = CheckoutSessionRequest(
+        amount=round(total, 2),
+        currency="cad",
+        success_url=success_url,
+        cancel_url=cancel_url,
+        metadata={
+            "order_id": order.id,
+            "order_number": order_number,
+            "customer_email": data.shipping_address.email
+        }
+    )
+    
+    try:
+        session = await stripe_checkout.create_checkout_session(checkout_request)
+    except Exception:
+        await release_reservation({"order_id": order.id})
+        raise
+    
+    # Update order with session ID
+    await db.orders.update_one(
+        {"id": order.id},
+        {"$set": {"stripe_session_id": session.session_id}}
+    )
+    await db.inventory_reservations.update_one(
+        {"order_id": order.id},
+        {"$set": {"session_id": session.session_id}}
+    )
+    
+    # Create payment transaction record
+    payment_tx = PaymentTransaction(
+        session_id=session.session_id,
+        order_id=order.id,
+        amount=round(total, 2),
+        currency="cad",
+        status="initiated",
+        payment_status="pending",
+        metadata={
+            "order_number": order_number,
+            "customer_email": data.shipping_address.email
+        },
+        expires_at=expires_at
+    )
+    tx_doc = payment_tx.model_dump()
+    tx_doc['created_at'] = tx_doc['created_at'].isoformat()
+    tx_doc['updated_at'] = tx_doc['updated_at'].isoformat()
+    await db.payment_transactions.insert_one(tx_doc)
+    
+    return {
+        "checkout_url": session.url,
+        "session_id": session.session_id,
+        "order_id": order.id,
+        "order_number": order_number
+    }
+
+@router.get("/checkout/status/{session_id}")
+async def get_checkout_status(session_id: str):
+    stripe_checkout = get_stripe_checkout()
+    
+    status = await stripe_checkout.get_checkout_status(session_id)
+    
+    # Update payment transaction
+    now = datetime.now(timezone.utc).isoformat()
+    tx_update: Dict[str, Any] = {"$set": {
+        "status": status.status,
+        "payment_status": status.payment_status,
+        "updated_at": now
+    }}
+    if status.payment_status == "paid":
+        # Paid rows are permanent; drop the expiry so neither the reaper nor the TTL index sees them
+        tx_update["$unset"] = {"expires_at": "", "purge_at": ""}
+        await ensure_checkout_in_hot_storage(session_id)
+    await db.payment_transactions.update_one({"session_id": session_id}, tx_update)
+    
+    # If paid, update order status
+    if status.payment_status == "paid":
+        tx = await db.payment_transactions.find_one({"session_id": session_id}, {"_id": 0})
+        if tx:
+            await mark_order_paid(tx["order_id"])
+    elif status.status == "expired":
+        await release_reservation({"session_id": session_id})
+    
+    return {
+        "status": status.status,
+        "payment_status": status.payment_status,
+        "amount_total": status.amount_total,
+        "currency": status.currency,
+        "metadata": status.metadata
+    }
+
+@router.get("/orders/{order_id}")
+async def get_order(order_id: str):
+    order = await db.orders.find_one({"id": order_id}, {"_id": 0})
+    if not order:
+        # Try by order number
+        order = await db.orders.find_one({"order_number": order_id}, {"_id": 0})
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    if isinstance(order.get('created_at'), str):
+        order['created_at'] = datetime.fromisoformat(order['created_at'])
+    return order
+
+@router.post("/webhook/stripe")
+async def stripe_webhook(request: Request):
+    body = await request.body()
+    signature = request.headers.get("Stripe-Signature", "")
+    
+    stripe_checkout = get_stripe_checkout()
+    
+    try:
+        webhook_response = await stripe_checkout.handle_webhook(body, signature)
+        
+        if webhook_response.payment_status == "paid":
+            session_id = webhook_response.session_id
+            now = datetime.now(timezone.utc).isoformat()
+            
+            await ensure_checkout_in_hot_storage(session_id)
+            await db.payment_transactions.update_one(
+                {"session_id": session_id},
+                {"$set": {
+                    "status": "complete",
+                    "payment_status": "paid",
+                    "updated_at": now
+                }, "$unset": {"expires_at": "", "purge_at": ""}}
+            )
+            
+            tx = await db.payment_transactions.find_one({"session_id": session_id}, {"_id": 0})
+            if tx:
+                await mark_order_paid(tx["order_id"])
+        elif webhook_response.event_type == "checkout.session.expired":
+            await release_reservation({"session_id": webhook_response.session_id})
+        
+        return {"status": "success"}
+    except Exception as e:
+        logger.error(f"Webhook error: {e}")
+        return {"status": "error", "message": str(e)}
@@ -0,0 +1,109 @@
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import WriteConcern
+from pymongo.monitoring import ConnectionPoolListener
+from pymongo.read_preferences import Primary, SecondaryPreferred
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Dict, Any
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# MongoDB connection
+# Records how long callers wait for a pooled connection and how long they hold it
+class PoolMetricsListener(ConnectionPoolListener):
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "in_use": 0,
+            "wait_ms_total": 0.0,
+            "wait_ms_max": 0.0,
+            "held_ms_total": 0.0,
+            "held_ms_max": 0.0,
+        }
+        # Motor runs pymongo calls on executor threads, so a checkout starts and ends on one thread
+        self._pending = threading.local()
+        self._checked_out: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+
+    def connection_check_out_started(self, event):
+        self._pending.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        now = time.perf_counter()
+        wait_ms = (now - getattr(self._pending, "started", now)) * 1000
+        with self._lock:
+            self.metrics["checkouts"] += 1
+            self.metrics["in_use"] += 1
+            self.metrics["wait_ms_total"] += wait_ms
+            self.metrics["wait_ms_max"] = max(self.metrics["wait_ms_max"], wait_ms)
+            self._checked_out[(event.address, event.connection_id)] = now
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.metrics["checkout_failures"] += 1
+
+    def connection_checked_in(self, event):
+        now = time.perf_counter()
+        with self._lock:
+            started = self._checked_out.pop((event.address, event.connection_id), None)
+            if started is None:
+                return
+            held_ms = (now - started) * 1000
+            self.metrics["in_use"] -= 1
+            self.metrics["held_ms_total"] += held_ms
+            self.metrics["held_ms_max"] = max(self.metrics["held_ms_max"], held_ms)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+pool_metrics = PoolMetricsListener()
+
+mongo_url = os.environ['MONGO_URL']
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '100')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '10')),
+    maxIdleTimeMS=int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '300000')),
+    waitQueueTimeoutMS=int(os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS', '2000')),
+    serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+    connectTimeoutMS=int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '5000')),
+    socketTimeoutMS=int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', '20000')),
+    compressors=os.environ.get('MONGO_COMPRESSORS', 'zlib'),
+    event_listeners=[pool_metrics]
+)
+# Checkout, order and payment traffic: primary reads, majority-acknowledged writes
+db = client.get_database(
+    os.environ['DB_NAME'],
+    read_preference=Primary(),
+    write_concern=WriteConcern(w="majority")
+)
+# Catalog and review reads tolerate bounded staleness and stay off the primary
+catalog_db = client.get_database(
+    os.environ['DB_NAME'],
+    read_preference=SecondaryPreferred(
+        max_staleness=int(os.environ.get('MONGO_CATALOG_MAX_STALENESS_SECONDS', '90'))
+    )
+)
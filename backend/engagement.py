@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+
+from database import db
+from models import Newsletter, NewsletterCreate, ContactMessage, ContactCreate
+
+router = APIRouter(prefix="/api")
+
+# ============== NEWSLETTER ==============
+
+@router.post("/newsletter")
+async def subscribe_newsletter(data: NewsletterCreate):
+    existing = await db.newsletter.find_one({"email": data.email.lower()})
+    if existing:
+        return {"message": "You're already subscribed!", "success": True}
+    
+    newsletter = Newsletter(email=data.email.lower())
+    doc = newsletter.model_dump()
+    doc['subscribed_at'] = doc['subscribed_at'].isoformat()
+    await db.newsletter.insert_one(doc)
+    return {"message": "Thank you for subscribing!", "success": True}
+
+# ============== CONTACT ==============
+
+@router.post("/contact")
+async def submit_contact(data: ContactCreate):
+    contact = ContactMessage(**data.model_dump())
+    doc = contact.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    await db.contact_messages.insert_one(doc)
+    return {"message": "Thank you for your message. We'll get back to you soon!", "success": True}
@@ -0,0 +1,202 @@
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+import os
+import random
+import logging
+
+from catalog import invalidate_catalog_cache
+from database import db
+from models import CartItem, ReservationLine, InventoryReservation
+
+logger = logging.getLogger(__name__)
+
+# ============== INVENTORY ==============
+
+# Each SKU's counter is split across shards so best-sellers don't serialize on one document
+INVENTORY_SHARDS = int(os.environ.get('INVENTORY_SHARDS', '4'))
+
+class OutOfStockError(Exception):
+    def __init__(self, sku: str):
+        super().__init__(f"Insufficient stock for {sku}")
+        self.sku = sku
+
+def make_sku(product_id: str, variant: Optional[str] = None) -> str:
+    return f"{product_id}:{variant}" if variant else product_id
+
+def sku_product_id(sku: str) -> str:
+    return sku.split(":", 1)[0]
+
+async def held_quantity(sku: str) -> int:
+    rows = await db.inventory_reservations.aggregate([
+        {"$match": {"status": "held", "lines.sku": sku}},
+        {"$unwind": "$lines"},
+        {"$match": {"lines.sku": sku}},
+        {"$group": {"_id": None, "quantity": {"$sum": "$lines.quantity"}}}
+    ]).to_list(1)
+    return rows[0]["quantity"] if rows else 0
+
+async def set_stock(product_id: str, variant: Optional[str], quantity: int) -> int:
+    # quantity is what's on hand, held carts included: their units go back to the shards on
+    # release, so only the remainder is made available now
+    sku = make_sku(product_id, variant)
+    available = quantity - await held_quantity(sku)
+    base, extra = divmod(available, INVENTORY_SHARDS)
+    for shard in range(INVENTORY_SHARDS):
+        await db.inventory_shards.update_one(
+            {"sku": sku, "shard": shard},
+            {"$set": {"stock": base + (1 if shard < extra else 0)}},
+            upsert=True
+        )
+    # A single sold-out variant doesn't take the whole product out of stock
+    if available > 0 or variant is None:
+        await db.products.update_one({"id": product_id}, {"$set": {"in_stock": available > 0}})
+    # Admin-set stock should show up right away; checkout-driven flips below can lag a TTL
+    invalidate_catalog_cache(read_primary=True)
+    return available
+
+async def resolve_sku(product_id: str, variant: Optional[str]) -> Optional[str]:
+    # Variants without their own counters draw from the product-level stock
+    if variant:
+        sku = make_sku(product_id, variant)
+        if await db.inventory_shards.find_one({"sku": sku}, {"_id": 1}):
+            return sku
+    if await db.inventory_shards.find_one({"sku": product_id}, {"_id": 1}):
+        return product_id
+    return None  # Untracked product
+
+async def get_stock(sku: str) -> Optional[int]:
+    shards = await db.inventory_shards.find({"sku": sku}, {"_id": 0, "stock": 1}).to_list(INVENTORY_SHARDS)
+    if not shards:
+        return None  # Untracked SKU
+    return sum(s["stock"] for s in shards)
+
+async def _take_from_shards(sku: str, quantity: int) -> Optional[List[ReservationLine]]:
+    # Fast path: a single random shard covers the whole quantity
+    order = random.sample(range(INVENTORY_SHARDS), INVENTORY_SHARDS)
+    for shard in order:
+        result = await db.inventory_shards.update_one(
+            {"sku": sku, "shard": shard, "stock": {"$gte": quantity}},
+            {"$inc": {"stock": -quantity}}
+        )
+        if result.modified_count:
+            return [ReservationLine(sku=sku, shard=shard, quantity=quantity)]
+    
+    shards = await db.inventory_shards.find({"sku": sku}, {"_id": 0}).to_list(INVENTORY_SHARDS)
+    if not shards:
+        return []  # Untracked SKU, nothing to reserve
+    
+    # Slow path: gather the quantity from several shards, each decrement still conditional
+    taken: List[ReservationLine] = []
+    remaining = quantity
+    for s in sorted(shards, key=lambda s: -s["stock"]):
+        take = min(s["stock"], remaining)
+        if take <= 0:
+            continue
+        result = await db.inventory_shards.update_one(
+            {"sku": sku, "shard": s["shard"], "stock": {"$gte": take}},
+            {"$inc": {"stock": -take}}
+        )
+        if result.modified_count:
+            taken.append(ReservationLine(sku=sku, shard=s["shard"], quantity=take))
+            remaining -= take
+            if remaining == 0:
+                return taken
+    
+    await _restore_lines(taken)
+    return None
+
+async def _restore_lines(lines: List[ReservationLine]):
+    for line in lines:
+        await db.inventory_shards.update_one(
+            {"sku": line.sku, "shard": line.shard},
+            {"$inc": {"stock": line.quantity}}
+        )
+
+async def reserve_inventory(order_id: str, items: List[CartItem], expires_at: datetime) -> InventoryReservation:
+    lines: List[ReservationLine] = []
+    for item in items:
+        sku = await resolve_sku(item.product_id, item.variant)
+        if sku is None:
+            continue
+        taken = await _take_from_shards(sku, item.quantity)
+        if taken is None:
+            await _restore_lines(lines)
+            # Same rule as set_stock: a sold-out variant leaves the product listed
+            if sku == item.product_id and await get_stock(sku) == 0:
+                await db.products.update_one({"id": item.product_id}, {"$set": {"in_stock": False}})
+                invalidate_catalog_cache()
+            raise OutOfStockError(sku)
+        lines.extend(taken)
+    
+    reservation = InventoryReservation(
+        order_id=order_id,
+        lines=lines,
+        expires_at=expires_at
+    )
+    # expires_at stays a native date so Mongo can range-scan it
+    await db.inventory_reservations.insert_one(reservation.model_dump())
+    return reservation
+
+async def commit_reservation(order_id: str):
+    now = datetime.now(timezone.utc)
+    held = await db.inventory_reservations.find_one_and_update(
+        {"order_id": order_id, "status": "held"},
+        {"$set": {"status": "committed", "closed_at": now}}
+    )
+    if held is not None:
+        return
+    # Paid after its hold was released (expiry, reaper, restored late payment): the units went
+    # back to the pool and may have been sold again. Status flip is the lock, as in release.
+    released = await db.inventory_reservations.find_one_and_update(
+        {"order_id": order_id, "status": "released"},
+        {"$set": {"status": "committed", "closed_at": now, "retaken": True}}
+    )
+    if released is None:
+        return
+    lines = [ReservationLine(**line) for line in released.get("lines", [])]
+    # Unconditional: the sale already happened, so stock may go negative and must show the oversell
+    for line in lines:
+        await db.inventory_shards.update_one(
+            {"sku": line.sku, "shard": line.shard},
+            {"$inc": {"stock": -line.quantity}}
+        )
+    for sku in {line.sku for line in lines}:
+        # Same rule as set_stock: only product-level counters take the product out of stock
+        if sku == sku_product_id(sku) and await get_stock(sku) <= 0:
+            await db.products.update_one({"id": sku}, {"$set": {"in_stock": False}})
+            invalidate_catalog_cache()
+    await db.orders.update_one(
+        {"id": order_id},
+        {"$set": {
+            "needs_review": True,
+            "review_reason": "Paid after its stock hold was released; fulfilment may be oversold"
+        }}
+    )
+    logger.error(f"Order {order_id} paid after its reservation was released; stock re-taken and order flagged")
+
+async def release_reservation(filter_: Dict[str, Any]) -> bool:
+    # Status flip is the lock: only one caller gets to restore the stock
+    held = await db.inventory_reservations.find_one_and_update(
+        {**filter_, "status": "held"},
+        {"$set": {"status": "released", "closed_at": datetime.now(timezone.utc)}}
+    )
+    if held is None:
+        return False
+    lines = [ReservationLine(**line) for line in held.get("lines", [])]
+    await _restore_lines(lines)
+    for product_id in {sku_product_id(line.sku) for line in lines}:
+        await db.products.update_one({"id": product_id}, {"$set": {"in_stock": True}})
+    if lines:
+        invalidate_catalog_cache()
+    return True
+
+async def release_expired_reservations() -> int:
+    released = 0
+    now = datetime.now(timezone.utc)
+    expired = await db.inventory_reservations.find(
+        {"status": "held", "expires_at": {"$lte": now}}, {"_id": 0, "id": 1}
+    ).to_list(500)
+    for r in expired:
+        if await release_reservation({"id": r["id"]}):
+            released += 1
+    return released
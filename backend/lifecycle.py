@@ -0,0 +1,133 @@
+from pymongo import ReplaceOne
+from typing import Dict, Any
+from datetime import datetime, timezone
+import os
+import time
+import asyncio
+import logging
+
+from database import db
+from inventory import release_reservation, release_expired_reservations
+
+logger = logging.getLogger(__name__)
+
+# ============== ORDER LIFECYCLE ==============
+
+# "archive" moves expired checkouts to cold collections; "delete" hands them to a TTL index
+LIFECYCLE_MODE = os.environ.get('LIFECYCLE_MODE', 'archive')
+LIFECYCLE_SWEEP_SECONDS = float(os.environ.get('LIFECYCLE_SWEEP_SECONDS', '60'))
+LIFECYCLE_BATCH_SIZE = int(os.environ.get('LIFECYCLE_BATCH_SIZE', '200'))
+LIFECYCLE_MAX_BATCHES = int(os.environ.get('LIFECYCLE_MAX_BATCHES', '10'))
+LIFECYCLE_BATCH_PAUSE_SECONDS = float(os.environ.get('LIFECYCLE_BATCH_PAUSE_SECONDS', '0.5'))
+ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', '90'))
+CLOSED_RESERVATION_RETENTION_DAYS = int(os.environ.get('CLOSED_RESERVATION_RETENTION_DAYS', '7'))
+
+lifecycle_metrics: Dict[str, Any] = {
+    "runs": 0,
+    "orders_expired": 0,
+    "transactions_expired": 0,
+    "rows_archived": 0,
+    "rows_scheduled_for_deletion": 0,
+    "reservations_released": 0,
+    "last_run_at": None,
+    "last_run_ms": None,
+}
+
+async def _expire_batch(now: datetime) -> int:
+    candidates = await db.orders.find(
+        {"payment_status": "pending", "expires_at": {"$lte": now}},
+        {"_id": 0, "id": 1}
+    ).limit(LIFECYCLE_BATCH_SIZE).to_list(LIFECYCLE_BATCH_SIZE)
+    order_ids = [o["id"] for o in candidates]
+    if not order_ids:
+        return 0
+    
+    # Conditional on still being pending so a payment recorded first is never expired;
+    # payments that arrive after the reap go through restore_archived_checkout
+    expired_update: Dict[str, Any] = {"$set": {"status": "expired", "payment_status": "expired"}}
+    if LIFECYCLE_MODE == "delete":
+        expired_update["$set"]["purge_at"] = now
+    orders = await db.orders.update_many(
+        {"id": {"$in": order_ids}, "payment_status": "pending"}, expired_update
+    )
+    # Status polls copy Stripe's raw payment_status ("unpaid", ...) onto the transaction,
+    # so anything short of paid counts as abandoned here
+    txs = await db.payment_transactions.update_many(
+        {"order_id": {"$in": order_ids}, "payment_status": {"$nin": ["paid", "expired"]}}, expired_update
+    )
+    lifecycle_metrics["orders_expired"] += orders.modified_count
+    lifecycle_metrics["transactions_expired"] += txs.modified_count
+    if LIFECYCLE_MODE == "delete":
+        lifecycle_metrics["rows_scheduled_for_deletion"] += orders.modified_count + txs.modified_count
+    
+    for order_id in order_ids:
+        await release_reservation({"order_id": order_id})
+    return len(order_ids)
+
+async def _archive_batch(now: datetime) -> int:
+    # Picks up every expired row, not just this run's, so a failed earlier pass is retried
+    archived = 0
+    for hot, cold in (
+        (db.orders, db.orders_archive),
+        (db.payment_transactions, db.payment_transactions_archive),
+    ):
+        rows = await hot.find(
+            {"payment_status": "expired"}, {"_id": 0}
+        ).limit(LIFECYCLE_BATCH_SIZE).to_list(LIFECYCLE_BATCH_SIZE)
+        if not rows:
+            continue
+        # Upserts by id, so concurrent reapers on other workers can't duplicate a row
+        await cold.bulk_write(
+            [ReplaceOne({"id": row["id"]}, {**row, "archived_at": now}, upsert=True) for row in rows],
+            ordered=False
+        )
+        await hot.delete_many({"id": {"$in": [row["id"] for row in rows]}, "payment_status": "expired"})
+        lifecycle_metrics["rows_archived"] += len(rows)
+        archived = max(archived, len(rows))
+    return archived
+
+async def restore_archived_checkout(session_id: str) -> bool:
+    # A customer can still pay on a session we already reaped; bring its rows back
+    tx = await db.payment_transactions_archive.find_one({"session_id": session_id}, {"_id": 0})
+    if tx is None:
+        logger.error(f"Payment for session {session_id} has no transaction in hot or archived collections")
+        return False
+    order = await db.orders_archive.find_one({"id": tx["order_id"]}, {"_id": 0})
+    for hot, cold, row in (
+        (db.payment_transactions, db.payment_transactions_archive, tx),
+        (db.orders, db.orders_archive, order),
+    ):
+        if row is None:
+            continue
+        row.pop("archived_at", None)
+        await hot.replace_one({"id": row["id"]}, row, upsert=True)
+        await cold.delete_one({"id": row["id"]})
+    if order is None:
+        logger.error(f"Payment for session {session_id} restored a transaction but its order {tx['order_id']} is gone")
+    else:
+        logger.warning(f"Restored archived order {order['id']} after a late payment")
+    return True
+
+async def reap_abandoned_checkouts():
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+    # Bounded, paced batches so the sweep never competes with checkout traffic
+    for _ in range(LIFECYCLE_MAX_BATCHES):
+        processed = await _expire_batch(now)
+        if LIFECYCLE_MODE != "delete":
+            processed = max(processed, await _archive_batch(now))
+        if processed < LIFECYCLE_BATCH_SIZE:
+            break
+        await asyncio.sleep(LIFECYCLE_BATCH_PAUSE_SECONDS)
+    lifecycle_metrics["reservations_released"] += await release_expired_reservations()
+    lifecycle_metrics["runs"] += 1
+    lifecycle_metrics["last_run_at"] = now.isoformat()
+    lifecycle_metrics["last_run_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+async def lifecycle_reaper():
+    while True:
+        try:
+            await reap_abandoned_checkouts()
+        except Exception as e:
+            logger.error(f"Lifecycle reaper error: {e}")
+        await asyncio.sleep(LIFECYCLE_SWEEP_SECONDS)
@@ -0,0 +1,198 @@
+from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from typing import List, Optional, Dict, Any
+import uuid
+from datetime import datetime, timezone
+
+# ============== MODELS ==============
+
+class ProductVariant(BaseModel):
+    name: str
+    value: str
+    price_modifier: float = 0.0
+
+class ProductImage(BaseModel):
+    url: str
+    alt: str
+    is_primary: bool = False
+
+class Product(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    slug: str
+    description: str
+    short_description: str
+    price: float
+    compare_at_price: Optional[float] = None
+    category: str
+    images: List[ProductImage] = []
+    variants: List[ProductVariant] = []
+    benefits: List[str] = []
+    how_to_use: str = ""
+    why_love_it: List[str] = []
+    in_stock: bool = True
+    featured: bool = False
+    meta_title: Optional[str] = None
+    meta_description: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ProductCreate(BaseModel):
+    name: str
+    slug: str
+    description: str
+    short_description: str
+    price: float
+    compare_at_price: Optional[float] = None
+    category: str
+    images: List[ProductImage] = []
+    variants: List[ProductVariant] = []
+    benefits: List[str] = []
+    how_to_use: str = ""
+    why_love_it: List[str] = []
+    in_stock: bool = True
+    featured: bool = False
+    meta_title: Optional[str] = None
+    meta_description: Optional[str] = None
+    stock: Optional[int] = Field(default=None, ge=0)
+
+class ProductUpdate(BaseModel):
+    name: Optional[str] = None
+    slug: Optional[str] = None
+    description: Optional[str] = None
+    short_description: Optional[str] = None
+    price: Optional[float] = None
+    compare_at_price: Optional[float] = None
+    category: Optional[str] = None
+    images: Optional[List[ProductImage]] = None
+    variants: Optional[List[ProductVariant]] = None
+    benefits: Optional[List[str]] = None
+    how_to_use: Optional[str] = None
+    why_love_it: Optional[List[str]] = None
+    in_stock: Optional[bool] = None
+    featured: Optional[bool] = None
+    meta_title: Optional[str] = None
+    meta_description: Optional[str] = None
+    stock: Optional[int] = Field(default=None, ge=0)
+
+class Review(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    product_id: str
+    author_name: str
+    rating: int = Field(ge=1, le=5)
+    title: str
+    content: str
+    verified_purchase: bool = False
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ReviewCreate(BaseModel):
+    product_id: str
+    author_name: str
+    rating: int = Field(ge=1, le=5)
+    title: str
+    content: str
+
+class Newsletter(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email: str
+    subscribed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    is_active: bool = True
+
+class NewsletterCreate(BaseModel):
+    email: EmailStr
+
+class CartItem(BaseModel):
+    product_id: str
+    product_name: str
+    product_image: str
+    variant: Optional[str] = None
+    price: float
+    quantity: int = Field(ge=1)
+
+class CartRequest(BaseModel):
+    items: List[CartItem]
+
+class ContactMessage(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    email: str
+    subject: str
+    message: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class ContactCreate(BaseModel):
+    name: str
+    email: EmailStr
+    subject: str
+    message: str
+
+class ShippingAddress(BaseModel):
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    address: str
+    city: str
+    province: str
+    postal_code: str
+    country: str = "Canada"
+
+class Order(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    order_number: str
+    items: List[CartItem]
+    shipping_address: ShippingAddress
+    subtotal: float
+    shipping_cost: float
+    tax: float
+    total: float
+    status: str = "pending"
+    payment_status: str = "pending"
+    stripe_session_id: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    paid_at: Optional[str] = None
+    needs_review: bool = False
+    review_reason: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class CheckoutRequest(BaseModel):
+    items: List[CartItem]
+    shipping_address: ShippingAddress
+    origin_url: str
+
+class PaymentTransaction(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str
+    order_id: str
+    amount: float
+    currency: str = "cad"
+    status: str = "initiated"
+    payment_status: str = "pending"
+    metadata: Dict[str, Any] = {}
+    expires_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class InventoryUpdate(BaseModel):
+    variant: Optional[str] = None
+    quantity: int = Field(ge=0)
+
+class ReservationLine(BaseModel):
+    sku: str
+    shard: int
+    quantity: int
+
+class InventoryReservation(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    order_id: str
+    session_id: Optional[str] = None
+    lines: List[ReservationLine] = []
+    status: str = "held"
+    expires_at: datetime
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
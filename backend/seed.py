@@ -0,0 +1,280 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from datetime import datetime, timezone, timedelta
+import os
+
+from database import db
+from models import Product, Review
+
+SEED_MARKER_KEY = "catalog_seed"
+# An in_progress marker older than this belongs to a worker that died mid-seed
+SEED_CLAIM_TIMEOUT_SECONDS = int(os.environ.get('SEED_CLAIM_TIMEOUT_SECONDS', '300'))
+
+async def seed_catalog():
+    now = datetime.now(timezone.utc)
+    # Mongo keeps millisecond precision; truncate so claimed_at can be matched exactly later
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    stale_before = now - timedelta(seconds=SEED_CLAIM_TIMEOUT_SECONDS)
+    # Claim the marker unless it is done or freshly claimed by another worker
+    try:
+        previous = await db.app_meta.find_one_and_update(
+            {
+                "key": SEED_MARKER_KEY,
+                "state": "in_progress",
+                "claimed_at": {"$lt": stale_before}
+            },
+            {"$set": {"key": SEED_MARKER_KEY, "state": "in_progress", "claimed_at": now}},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+    except DuplicateKeyError:
+        marker = await db.app_meta.find_one({"key": SEED_MARKER_KEY}, {"_id": 0})
+        if marker and marker.get("state") == "in_progress":
+            return {"message": "Catalog seeding already in progress", "seeded": False}
+        return {"message": "Catalog already seeded", "seeded": False}
+    
+    # Databases populated before any marker existed are left untouched;
+    # a reclaimed marker means our own earlier run stopped partway, so finish it
+    if previous is None:
+        count = await db.products.estimated_document_count()
+        if count > 0:
+            await _finish_marker(now)
+            return {"message": f"Database already has {count} products", "seeded": False}
+    
+    try:
+        result = await _write_seed_data()
+    except BaseException:
+        # Release the claim so the next startup, CLI run or admin call can retry
+        await db.app_meta.delete_one({"key": SEED_MARKER_KEY, "claimed_at": now})
+        raise
+    await _finish_marker(now)
+    return result
+
+async def _finish_marker(claimed_at: datetime):
+    await db.app_meta.update_one(
+        {"key": SEED_MARKER_KEY, "claimed_at": claimed_at},
+        {"$set": {"state": "done", "seeded_at": datetime.now(timezone.utc).isoformat()}}
+    )
+
+async def _write_seed_data():
+    products = [
+        {
+            "name": "Rose Quartz Gua Sha",
+            "slug": "rose-quartz-gua-sha",
+            "description": "Handcrafted from premium rose quartz, this traditional facial tool promotes lymphatic drainage and reduces puffiness. The natural cooling properties of the stone help soothe and calm your skin.",
+            "short_description": "Premium rose quartz facial sculpting tool",
+            "price": 42.00,
+            "compare_at_price": 55.00,
+            "category": "gua-sha",
+            "images": [
+                {"url": "https://images.pexels.com/photos/6621434/pexels-photo-6621434.jpeg", "alt": "Rose Quartz Gua Sha", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Stone", "value": "Rose Quartz", "price_modifier": 0},
+                {"name": "Stone", "value": "Jade", "price_modifier": 5.00},
+                {"name": "Stone", "value": "Obsidian", "price_modifier": 8.00}
+            ],
+            "benefits": ["Reduces puffiness", "Promotes lymphatic drainage", "Improves circulation", "Natural cooling effect"],
+            "how_to_use": "Apply facial oil or serum. Hold the tool at a 15-degree angle against your skin. Use gentle, upward strokes from the center of your face outward. Repeat 3-5 times per area.",
+            "why_love_it": ["100% authentic rose quartz", "Ergonomic design for easy grip", "Comes with silk storage pouch"],
+            "in_stock": True,
+            "featured": True,
+            "meta_title": "Rose Quartz Gua Sha - Beautivra",
+            "meta_description": "Premium rose quartz gua sha tool for facial sculpting and lymphatic drainage."
+        },
+        {
+            "name": "Cryo Ice Roller",
+            "slug": "cryo-ice-roller",
+            "description": "Our signature ice roller features a stainless steel head that stays cold longer than traditional ice rollers. Perfect for morning de-puffing and soothing irritated skin.",
+            "short_description": "Professional-grade stainless steel ice roller",
+            "price": 38.00,
+            "compare_at_price": None,
+            "category": "ice-rollers",
+            "images": [
+                {"url": "https://images.pexels.com/photos/5928035/pexels-photo-5928035.jpeg", "alt": "Cryo Ice Roller", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Silver", "price_modifier": 0},
+                {"name": "Color", "value": "Rose Gold", "price_modifier": 5.00},
+                {"name": "Color", "value": "Black", "price_modifier": 5.00}
+            ],
+            "benefits": ["Instant de-puffing", "Calms redness and irritation", "Tightens pores", "Relieves headaches"],
+            "how_to_use": "Store in freezer for at least 2 hours. Roll gently across face in upward and outward motions. Use for 5-10 minutes for best results.",
+            "why_love_it": ["Medical-grade stainless steel", "Stays cold 2x longer", "Easy-grip silicone handle"],
+            "in_stock": True,
+            "featured": True,
+            "meta_title": "Cryo Ice Roller - Beautivra",
+            "meta_description": "Professional stainless steel ice roller for instant de-puffing and skin soothing."
+        },
+        {
+            "name": "Jade Face Roller",
+            "slug": "jade-face-roller",
+            "description": "Authentic Xiuyan jade double-ended roller. The larger stone is perfect for cheeks and forehead, while the smaller end targets delicate areas around eyes and nose.",
+            "short_description": "Dual-ended authentic jade facial roller",
+            "price": 48.00,
+            "compare_at_price": 65.00,
+            "category": "face-rollers",
+            "images": [
+                {"url": "https://images.pexels.com/photos/7208722/pexels-photo-7208722.jpeg", "alt": "Jade Face Roller", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Stone", "value": "Green Jade", "price_modifier": 0},
+                {"name": "Stone", "value": "White Jade", "price_modifier": 10.00}
+            ],
+            "benefits": ["Reduces fine lines", "Increases product absorption", "Promotes blood circulation", "Natural cooling"],
+            "how_to_use": "Start at neck, rolling upward. Move to jawline, cheeks, forehead. Use small roller around eyes. Roll each area 5-10 times.",
+            "why_love_it": ["100% authentic Xiuyan jade", "Smooth, silent rolling mechanism", "Dual-ended for all facial areas"],
+            "in_stock": True,
+            "featured": True,
+            "meta_title": "Jade Face Roller - Beautivra",
+            "meta_description": "Authentic Xiuyan jade face roller for facial massage and skincare absorption."
+        },
+        {
+            "name": "Scalp Revival Massager",
+            "slug": "scalp-revival-massager",
+            "description": "Ergonomic silicone scalp massager with soft bristles that stimulate blood flow and distribute natural oils. Perfect for use in shower with shampoo or dry for relaxation.",
+            "short_description": "Ergonomic silicone scalp massage brush",
+            "price": 18.00,
+            "compare_at_price": None,
+            "category": "scalp-massagers",
+            "images": [
+                {"url": "https://images.pexels.com/photos/3785802/pexels-photo-3785802.jpeg", "alt": "Scalp Massager", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Blush Pink", "price_modifier": 0},
+                {"name": "Color", "value": "Sage Green", "price_modifier": 0},
+                {"name": "Color", "value": "Charcoal", "price_modifier": 0}
+            ],
+            "benefits": ["Stimulates hair growth", "Reduces dandruff", "Relieves tension headaches", "Deep cleanses scalp"],
+            "how_to_use": "Use wet or dry. Apply gentle pressure and move in circular motions across entire scalp. Use 3-5 minutes daily.",
+            "why_love_it": ["Ultra-soft medical-grade silicone", "Ergonomic palm-fit design", "Waterproof for shower use"],
+            "in_stock": True,
+            "featured": True,
+            "meta_title": "Scalp Revival Massager - Beautivra",
+            "meta_description": "Silicone scalp massager for hair growth stimulation and relaxation."
+        },
+        {
+            "name": "Hair Oil Applicator Comb",
+            "slug": "hair-oil-applicator-comb",
+            "description": "Precision oil applicator with built-in reservoir and fine-tooth comb. Apply oils directly to roots without mess or waste.",
+            "short_description": "Precision hair oil application tool",
+            "price": 22.00,
+            "compare_at_price": None,
+            "category": "hair-oil-applicators",
+            "images": [
+                {"url": "https://images.pexels.com/photos/7796746/pexels-photo-7796746.jpeg", "alt": "Hair Oil Applicator", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Clear", "price_modifier": 0},
+                {"name": "Color", "value": "Black", "price_modifier": 0}
+            ],
+            "benefits": ["No mess application", "Even distribution", "Saves product", "Easy cleaning"],
+            "how_to_use": "Fill reservoir with oil. Part hair and apply directly to scalp. Comb through to distribute evenly.",
+            "why_love_it": ["150ml capacity", "Precision nozzle tip", "Wide-tooth comb attachment included"],
+            "in_stock": True,
+            "featured": False,
+            "meta_title": "Hair Oil Applicator - Beautivra",
+            "meta_description": "Precision hair oil applicator comb for mess-free scalp treatments."
+        },
+        {
+            "name": "Cooling Under Eye Wands",
+            "slug": "cooling-under-eye-wands",
+            "description": "Set of two zinc alloy cooling wands designed specifically for the delicate under-eye area. Reduces puffiness, dark circles, and fine lines.",
+            "short_description": "Zinc alloy under-eye cooling wands (set of 2)",
+            "price": 28.00,
+            "compare_at_price": 35.00,
+            "category": "under-eye-tools",
+            "images": [
+                {"url": "https://images.unsplash.com/photo-1573248303663-37d7a727a4bf", "alt": "Under Eye Cooling Wands", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Silver", "price_modifier": 0},
+                {"name": "Color", "value": "Rose Gold", "price_modifier": 3.00}
+            ],
+            "benefits": ["Reduces dark circles", "Minimizes puffiness", "Smooths fine lines", "Enhances serum absorption"],
+            "how_to_use": "Store in refrigerator. Apply eye cream, then gently press and roll wand from inner to outer corner. Repeat 5-10 times.",
+            "why_love_it": ["Ergonomic curved design", "Stays cold for 20+ minutes", "Perfect for travel"],
+            "in_stock": True,
+            "featured": False,
+            "meta_title": "Under Eye Cooling Wands - Beautivra",
+            "meta_description": "Zinc alloy cooling wands for reducing under-eye puffiness and dark circles."
+        },
+        {
+            "name": "Sonic Cleansing Brush",
+            "slug": "sonic-cleansing-brush",
+            "description": "Rechargeable sonic facial brush with ultra-soft silicone bristles. Three speed settings for gentle daily cleansing to deep exfoliation.",
+            "short_description": "Rechargeable sonic silicone face brush",
+            "price": 58.00,
+            "compare_at_price": 75.00,
+            "category": "cleansing-brushes",
+            "images": [
+                {"url": "https://images.pexels.com/photos/6621434/pexels-photo-6621434.jpeg", "alt": "Sonic Cleansing Brush", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Blush", "price_modifier": 0},
+                {"name": "Color", "value": "Mint", "price_modifier": 0},
+                {"name": "Color", "value": "White", "price_modifier": 0}
+            ],
+            "benefits": ["Removes 99% of dirt and makeup", "Unclogs pores", "Gentle exfoliation", "Improves product absorption"],
+            "how_to_use": "Wet face and apply cleanser. Turn on device and gently move across face in circular motions. Rinse and pat dry.",
+            "why_love_it": ["8000 sonic pulses per minute", "Waterproof IPX7 rated", "USB rechargeable, 90 day battery"],
+            "in_stock": True,
+            "featured": True,
+            "meta_title": "Sonic Cleansing Brush - Beautivra",
+            "meta_description": "Rechargeable sonic facial cleansing brush with silicone bristles."
+        },
+        {
+            "name": "Minimalist Beauty Organizer",
+            "slug": "minimalist-beauty-organizer",
+            "description": "Elegant acrylic organizer with dedicated slots for your Beautivra tools. Features velvet-lined compartments and a dust cover.",
+            "short_description": "Acrylic tool organizer with dust cover",
+            "price": 45.00,
+            "compare_at_price": None,
+            "category": "beauty-organizers",
+            "images": [
+                {"url": "https://images.pexels.com/photos/5928035/pexels-photo-5928035.jpeg", "alt": "Beauty Organizer", "is_primary": True}
+            ],
+            "variants": [
+                {"name": "Color", "value": "Clear", "price_modifier": 0},
+                {"name": "Color", "value": "Rose Tint", "price_modifier": 8.00}
+            ],
+            "benefits": ["Keeps tools organized", "Protects from dust", "Display-worthy design", "Easy access"],
+            "how_to_use": "Place your tools in designated compartments. Cover when not in use to protect from dust.",
+            "why_love_it": ["Premium acrylic construction", "Velvet-lined compartments", "Stackable design"],
+            "in_stock": True,
+            "featured": False,
+            "meta_title": "Beauty Organizer - Beautivra",
+            "meta_description": "Minimalist acrylic beauty tool organizer with dust cover."
+        }
+    ]
+    
+    # Upserts by slug, so finishing an interrupted run doesn't duplicate products
+    for p in products:
+        product = Product(**p)
+        doc = product.model_dump()
+        doc['created_at'] = doc['created_at'].isoformat()
+        doc['updated_at'] = doc['updated_at'].isoformat()
+        await db.products.update_one({"slug": doc["slug"]}, {"$setOnInsert": doc}, upsert=True)
+    
+    # Add sample reviews
+    sample_reviews = [
+        {"product_id": "", "author_name": "Sarah M.", "rating": 5, "title": "Life changing!", "content": "I use this every morning and my skin has never looked better. The quality is amazing.", "verified_purchase": True},
+        {"product_id": "", "author_name": "Emily R.", "rating": 4, "title": "Great quality", "content": "Beautiful design and works exactly as described. Shipping was fast too!", "verified_purchase": True},
+        {"product_id": "", "author_name": "Jessica L.", "rating": 5, "title": "So relaxing", "content": "My new favorite part of my skincare routine. Feels so luxurious.", "verified_purchase": True},
+    ]
+    
+    # Get first product ID for reviews
+    first_product = await db.products.find_one({"slug": products[0]["slug"]}, {"_id": 0, "id": 1})
+    if first_product:
+        for review_data in sample_reviews:
+            review_data["product_id"] = first_product["id"]
+            review = Review(**review_data)
+            doc = review.model_dump()
+            doc['created_at'] = doc['created_at'].isoformat()
+            await db.reviews.update_one(
+                {"product_id": doc["product_id"], "author_name": doc["author_name"], "title": doc["title"]},
+                {"$setOnInsert": doc},
+                upsert=True
+            )
+    
+    return {"message": f"Seeded {len(products)} products and {len(sample_reviews)} reviews", "seeded": True}
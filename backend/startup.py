@@ -0,0 +1,66 @@
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any
+
+# Reference point for "time to ready"; server.py imports this module before anything else
+BOOT_STARTED = time.perf_counter()
+
+startup_report: Dict[str, Any] = {
+    # Wall time of each import step in server.py, including every dependency it was first to load
+    "import_steps_ms": {},
+    # Top-level packages each step loaded; a step whose modules an earlier step pulled in shows ~0ms
+    "import_steps_loaded": {},
+    "import_total_ms": None,
+    "warm_up_ms": None,
+    "ready_ms": None,
+}
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+def _top_level_packages() -> set:
+    # Standard library modules are left out; they're cheap and would drown the listing
+    return {
+        top for top in (name.split(".", 1)[0] for name in list(sys.modules))
+        if top not in sys.stdlib_module_names and not top.startswith("_")
+    }
+
+@contextmanager
+def timed_import(step: str):
+    before = _top_level_packages()
+    started = time.perf_counter()
+    yield
+    startup_report["import_steps_ms"][step] = elapsed_ms(started)
+    startup_report["import_steps_loaded"][step] = sorted(_top_level_packages() - before)
+
+def mark_imported():
+    startup_report["import_total_ms"] = elapsed_ms(BOOT_STARTED)
+
+def mark_ready(warm_up_started: float):
+    startup_report["warm_up_ms"] = elapsed_ms(warm_up_started)
+    startup_report["ready_ms"] = elapsed_ms(BOOT_STARTED)
+
+def import_self_ms_by_package(module: str) -> Dict[str, float]:
+    # Each package's own import cost, excluding its dependencies, from `python -X importtime`
+    # in a fresh interpreter; too slow for worker boot, so only the startup-report CLI uses it
+    import subprocess
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent
+    )
+    self_us: Dict[str, int] = defaultdict(int)
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, _, name = line[len("import time:"):].split("|")
+        self_us[name.strip().split(".", 1)[0]] += int(self_part)
+    return {
+        package: round(us / 1000, 1)
+        for package, us in sorted(self_us.items(), key=lambda item: -item[1])
+    }
@@ -128,7 +128,11 @@ const CheckoutPage = () => {
       }
     } catch (error) {
       console.error('Checkout error:', error);
-      toast.error('Something went wrong. Please try again.');
+      if (error.response?.status === 409) {
+        toast.error(error.response.data.detail);
+      } else {
+        toast.error('Something went wrong. Please try again.');
+      }
       setLoading(false);
     }
   };
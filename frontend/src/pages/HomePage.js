@@ -15,9 +15,6 @@ const HomePage = () => {
   useEffect(() => {
     const fetchProducts = async () => {
       try {
-        // First try to seed products
-        await axios.post(`${API}/admin/seed`);
-        // Then fetch featured products
         const response = await axios.get(`${API}/products?featured=true&limit=4`);
         setFeaturedProducts(response.data);
       } catch (error) {
@@ -0,0 +1,41 @@
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Each run gets a throwaway database; set before database.py loads backend/.env
+os.environ["DB_NAME"] = f"test_beautivra_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+def mongo():
+    pytest.importorskip("motor")
+    pytest.importorskip("fastapi")
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    import database
+
+    sync_client = MongoClient(database.mongo_url, serverSelectionTimeoutMS=1000)
+    try:
+        sync_client.admin.command("ping")
+    except PyMongoError:
+        sync_client.close()
+        pytest.skip("MONGO_URL is unreachable")
+    yield sync_client[os.environ["DB_NAME"]]
+    sync_client.drop_database(os.environ["DB_NAME"])
+    sync_client.close()
+
+
+@pytest.fixture(scope="session")
+def run(mongo):
+    # Motor binds its client to the first event loop it sees, so every test shares one
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
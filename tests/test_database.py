@@ -0,0 +1,44 @@
+import uuid
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def replica_set(mongo):
+    import database
+
+    if "replicaSet=" not in database.mongo_url:
+        pytest.skip("MONGO_URL does not name a replicaSet")
+
+
+def test_handles_route_reads_and_writes(replica_set):
+    from pymongo.read_preferences import Primary, SecondaryPreferred
+    from database import catalog_db, db
+
+    assert isinstance(catalog_db.read_preference, SecondaryPreferred)
+    assert catalog_db.read_preference.max_staleness > 0
+    assert isinstance(db.read_preference, Primary)
+    assert db.write_concern.document == {"w": "majority"}
+
+
+def test_checkout_write_and_catalog_read_against_replica_set(replica_set, run):
+    from pymongo import ReadPreference
+    from database import catalog_db, db
+
+    async def scenario():
+        topology = await db.command("hello")
+        assert topology["setName"]
+
+        order_id = str(uuid.uuid4())
+        # Acknowledged by a majority, so it is readable from the primary straight away
+        result = await db.orders.insert_one({"id": order_id, "status": "pending", "payment_status": "pending"})
+        assert result.acknowledged
+        assert (await db.orders.find_one({"id": order_id}))["status"] == "pending"
+
+        product_id = str(uuid.uuid4())
+        await db.products.insert_one({"id": product_id, "featured": True})
+        # On a single-host set SecondaryPreferred falls back to the primary
+        assert await catalog_db.products.find_one({"id": product_id}, {"_id": 0}) == {"id": product_id, "featured": True}
+        assert catalog_db.read_preference.mode == ReadPreference.SECONDARY_PREFERRED.mode
+
+    run(scenario())
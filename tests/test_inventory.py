@@ -0,0 +1,110 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+
+def _cart_item(product_id, variant=None, quantity=1):
+    from models import CartItem
+
+    return CartItem(
+        product_id=product_id,
+        product_name="Test Roller",
+        product_image="",
+        variant=variant,
+        price=10.0,
+        quantity=quantity,
+    )
+
+
+def test_concurrent_checkouts_never_oversell(run):
+    import inventory
+
+    async def scenario():
+        product_id = f"product-{uuid.uuid4()}"
+        await inventory.set_stock(product_id, None, 10)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+        item = _cart_item(product_id)
+
+        results = await asyncio.gather(
+            *(inventory.reserve_inventory(f"order-{i}", [item], expires_at) for i in range(1000)),
+            return_exceptions=True,
+        )
+        failures = [r for r in results if isinstance(r, Exception)]
+        assert all(isinstance(f, inventory.OutOfStockError) for f in failures)
+        assert len(results) - len(failures) == 10
+        assert await inventory.get_stock(product_id) == 0
+
+    run(scenario())
+
+
+def test_variant_without_own_stock_draws_from_product(run):
+    import inventory
+
+    async def scenario():
+        product_id = f"product-{uuid.uuid4()}"
+        await inventory.set_stock(product_id, None, 3)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+
+        reservation = await inventory.reserve_inventory(
+            "order-variant", [_cart_item(product_id, variant="Rose Gold", quantity=2)], expires_at
+        )
+        assert [line.sku for line in reservation.lines] == [product_id] * len(reservation.lines)
+        assert await inventory.get_stock(product_id) == 1
+
+    run(scenario())
+
+
+def test_restock_during_held_reservation_does_not_inflate_stock(run):
+    import inventory
+
+    async def scenario():
+        product_id = f"product-{uuid.uuid4()}"
+        await inventory.set_stock(product_id, None, 10)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+        order_id = f"order-{uuid.uuid4()}"
+        await inventory.reserve_inventory(order_id, [_cart_item(product_id, quantity=3)], expires_at)
+
+        # Admin counts 10 on the shelf, 3 of which are still in a customer's cart
+        assert await inventory.set_stock(product_id, None, 10) == 7
+        await inventory.release_reservation({"order_id": order_id})
+        assert await inventory.get_stock(product_id) == 10
+
+    run(scenario())
+
+
+def test_payment_after_release_retakes_stock_and_flags_order(run):
+    from database import db
+    import inventory
+
+    async def scenario():
+        product_id = f"product-{uuid.uuid4()}"
+        await inventory.set_stock(product_id, None, 3)
+        await db.products.insert_one({"id": product_id, "in_stock": True})
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+        late, other = f"order-{uuid.uuid4()}", f"order-{uuid.uuid4()}"
+        await db.orders.insert_one({"id": late, "payment_status": "paid"})
+
+        await inventory.reserve_inventory(late, [_cart_item(product_id, quantity=3)], expires_at)
+        await inventory.release_reservation({"order_id": late})
+        # The released units sell again before the late payment lands
+        await inventory.reserve_inventory(other, [_cart_item(product_id, quantity=3)], expires_at)
+        await inventory.commit_reservation(late)
+        await inventory.commit_reservation(late)
+
+        assert await inventory.get_stock(product_id) == -3
+        order = await db.orders.find_one({"id": late})
+        assert order["needs_review"] is True
+        assert (await db.products.find_one({"id": product_id}))["in_stock"] is False
+
+    run(scenario())
+
+
+@pytest.mark.parametrize("quantity", [0, -5])
+def test_cart_rejects_non_positive_quantities(quantity):
+    from pydantic import ValidationError
+
+    # A negative line would pass every stock guard and add units back to the shards
+    with pytest.raises(ValidationError):
+        _cart_item("product-any", quantity=quantity)
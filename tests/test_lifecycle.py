@@ -0,0 +1,80 @@
+import uuid
+from datetime import datetime, timezone, timedelta
+
+ROUNDS = 10
+CHECKOUTS_PER_ROUND = 100
+ABANDONED_PER_ROUND = 90  # 90% abandonment
+PAID_PER_ROUND = CHECKOUTS_PER_ROUND - ABANDONED_PER_ROUND
+
+
+async def _simulate_checkouts(db):
+    now = datetime.now(timezone.utc)
+    orders, transactions = [], []
+    for i in range(CHECKOUTS_PER_ROUND):
+        order_id = str(uuid.uuid4())
+        abandoned = i < ABANDONED_PER_ROUND
+        status = "pending" if abandoned else "paid"
+        order = {"id": order_id, "status": status, "payment_status": status, "total": 10.0}
+        tx = {"id": str(uuid.uuid4()), "order_id": order_id, "session_id": f"cs_{order_id}", "payment_status": status}
+        if abandoned:
+            # Session lifetime already elapsed
+            order["expires_at"] = tx["expires_at"] = now - timedelta(minutes=1)
+        orders.append(order)
+        transactions.append(tx)
+    await db.orders.insert_many(orders)
+    await db.payment_transactions.insert_many(transactions)
+
+
+def test_working_set_stays_stable_under_abandonment(run):
+    from database import db
+    import lifecycle
+
+    async def scenario():
+        # Rows other tests left in the shared database
+        baseline = [
+            await collection.count_documents({})
+            for collection in (db.orders, db.payment_transactions, db.orders_archive, db.payment_transactions_archive)
+        ]
+        working_sets = []
+        for round_number in range(1, ROUNDS + 1):
+            await _simulate_checkouts(db)
+            await lifecycle.reap_abandoned_checkouts()
+
+            paid = round_number * PAID_PER_ROUND
+            orders = await db.orders.count_documents({}) - baseline[0]
+            transactions = await db.payment_transactions.count_documents({}) - baseline[1]
+            # Only paid rows stay hot; everything abandoned has been reaped
+            working_sets.append((orders - paid, transactions - paid))
+
+        assert working_sets == [(0, 0)] * ROUNDS
+        abandoned = ROUNDS * ABANDONED_PER_ROUND
+        assert await db.orders_archive.count_documents({}) - baseline[2] == abandoned
+        assert await db.payment_transactions_archive.count_documents({}) - baseline[3] == abandoned
+
+    run(scenario())
+
+
+def test_polled_unpaid_transaction_is_reaped_with_its_order(run):
+    from database import db
+    import lifecycle
+
+    async def scenario():
+        order_id = str(uuid.uuid4())
+        session_id = f"cs_{order_id}"
+        expired = datetime.now(timezone.utc) - timedelta(minutes=1)
+        await db.orders.insert_one(
+            {"id": order_id, "status": "pending", "payment_status": "pending", "expires_at": expired}
+        )
+        # The confirmation page's status poll has copied Stripe's raw status onto the row
+        await db.payment_transactions.insert_one(
+            {"id": str(uuid.uuid4()), "order_id": order_id, "session_id": session_id,
+             "status": "open", "payment_status": "unpaid", "expires_at": expired}
+        )
+        await lifecycle.reap_abandoned_checkouts()
+
+        assert await db.orders.find_one({"id": order_id}) is None
+        assert await db.payment_transactions.find_one({"session_id": session_id}) is None
+        archived = await db.payment_transactions_archive.find_one({"session_id": session_id})
+        assert archived["payment_status"] == "expired"
+
+    run(scenario())
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVER = Path(__file__).resolve().parent.parent / "backend" / "server.py"
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "1500"))
+
+
+def test_backend_import_time_within_budget():
+    pytest.importorskip("fastapi")
+    pytest.importorskip("motor")
+
+    # Fresh interpreter so nothing is already cached in sys.modules
+    result = subprocess.run(
+        [sys.executable, str(SERVER), "startup-report"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "IMPORT_BUDGET_MS": str(IMPORT_BUDGET_MS)},
+    )
+    report, _ = json.JSONDecoder().raw_decode(result.stdout)
+
+    assert report["import_total_ms"] <= IMPORT_BUDGET_MS, report["import_self_ms_by_package"]
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_payments_and_seed_data_load_lazily():
+    pytest.importorskip("fastapi")
+    pytest.importorskip("motor")
+
+    probe = "import server, sys; print([m for m in ('seed', 'emergentintegrations') if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        cwd=SERVER.parent,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
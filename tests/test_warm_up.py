@@ -0,0 +1,72 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+RUNS = int(os.environ.get("WARM_UP_BENCH_RUNS", "5"))
+
+# Boots the app in a fresh interpreter and times the storefront's first request.
+# "cold" drops the startup hooks, which is how the app booted before warm-up existed.
+PROBE = """
+import json, sys, time
+from fastapi.testclient import TestClient
+import server
+from catalog import catalog_cache
+
+if sys.argv[1] == "cold":
+    server.app.router.on_startup.clear()
+with TestClient(server.app) as client:
+    loaded_at = catalog_cache["loaded_at"]
+    started = time.perf_counter()
+    first = client.get("/api/products", params={"featured": "true"})
+    first_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    client.get("/api/products", params={"featured": "true"})
+    second_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({
+    "status": first.status_code,
+    "products": len(first.json()),
+    "first_request_ms": round(first_ms, 1),
+    "second_request_ms": round(second_ms, 1),
+    "served_from_cache": catalog_cache["loaded_at"] == loaded_at and loaded_at > 0,
+}))
+"""
+
+
+def _run(*args):
+    result = subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, timeout=120, cwd=BACKEND_DIR,
+        env={**os.environ, "SEED_ON_STARTUP": "false"},
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return result.stdout
+
+
+def measure_first_request(mode):
+    return json.loads(_run("-c", PROBE, mode).strip().splitlines()[-1])
+
+
+def test_warm_up_serves_first_storefront_request_from_cache(mongo):
+    _run("server.py", "seed")
+
+    cold = measure_first_request("cold")
+    warm = measure_first_request("warm")
+
+    assert cold["status"] == warm["status"] == 200
+    assert cold["products"] == warm["products"] > 0
+    assert not cold["served_from_cache"]
+    assert warm["served_from_cache"]
+
+
+if __name__ == "__main__":
+    # `python tests/test_warm_up.py` against MONGO_URL/DB_NAME from backend/.env
+    _run("server.py", "seed")
+    for mode in ("cold", "warm"):
+        samples = [measure_first_request(mode) for _ in range(RUNS)]
+        print(
+            f"{mode}: first request median {statistics.median(s['first_request_ms'] for s in samples):.1f}ms, "
+            f"second {statistics.median(s['second_request_ms'] for s in samples):.1f}ms over {RUNS} boots"
+        )